@@ -0,0 +1,379 @@
+import argparse
+import contextlib
+import datetime
+import gc
+import importlib.util
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import python_tooling_inputs as inputs
+
+# Benchmarks for the Python tooling under scripts/agent.
+#
+# Usage:
+#   python benchmarks/python_tooling_bench.py run [--sizes 1MB,10MB,100MB,1GB] [--baseline old.json]
+#   python benchmarks/python_tooling_bench.py compare old.json new.json
+#
+# `run` generates synthetic inputs, measures throughput, peak memory
+# (tracemalloc) and interpreter startup for each script, and writes the
+# results to JSON. Passing --baseline (or using `compare`) turns it into a
+# regression gate: the process exits 1 when any metric gets worse than the
+# allowed tolerance.
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+AGENT_DIR = os.path.join(REPO_ROOT, "scripts", "agent")
+
+SCRIPTS = {
+    "parse_lint": os.path.join(AGENT_DIR, "audit-parsers", "parse_lint.py"),
+    "parse_file_size": os.path.join(AGENT_DIR, "audit-parsers", "parse_file_size.py"),
+    "parse_innerhtml": os.path.join(AGENT_DIR, "audit-parsers", "parse_innerhtml.py"),
+    "generate_summary": os.path.join(AGENT_DIR, "audit-reporters", "generate_summary.py"),
+    "analyze_deps": os.path.join(AGENT_DIR, "analyze_deps.py"),
+}
+
+LOG_PARSERS = [
+    ("parse_lint", "parse_lint_log", inputs.generate_lint_log),
+    ("parse_file_size", "parse_file_size_log", inputs.generate_file_size_log),
+    ("parse_innerhtml", "parse_innerhtml_log", inputs.generate_innerhtml_log),
+]
+
+# Metric name -> True when a larger value is better.
+METRICS = {
+    "seconds": False,
+    "throughput": True,
+    "peak_memory_bytes": False,
+    "startup_seconds": False,
+}
+MEMORY_METRICS = {"peak_memory_bytes"}
+TIMING_METRICS = {"seconds", "startup_seconds"}
+GATED_METRICS = TIMING_METRICS | MEMORY_METRICS
+
+DEFAULT_SIZES = "1MB,10MB,100MB"
+DEFAULT_ADVISORIES = "1000,5000"
+DEFAULT_OFFENDERS = "1000,10000,100000"
+
+def load_script(name):
+    spec = importlib.util.spec_from_file_location(f"bench_{name}", SCRIPTS[name])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def measure(fn, repeat):
+    """
+    Times `fn` `repeat` times, then runs it once more under tracemalloc for
+    the peak. The traced run is kept separate because tracemalloc slows
+    allocation-heavy code down considerably.
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds": min(times),
+        "median_seconds": statistics.median(times),
+        "peak_memory_bytes": peak,
+    }
+
+def measure_startup(args, cwd, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable] + args,
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        times.append(time.perf_counter() - start)
+    # The fastest launch is far more stable between runs than the median.
+    return {"startup_seconds": min(times), "median_startup_seconds": statistics.median(times)}
+
+@contextlib.contextmanager
+def working_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+def parse_list(value, parse=int):
+    return [parse(item) for item in value.split(",") if item.strip()]
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+def ensure_input(filepath, generate, *args, min_bytes=0):
+    # Generated inputs are deterministic, so a file left in --workdir by a
+    # previous run can be reused as-is. This matters for the 1 GB logs.
+    # Inputs are written to a temporary name and moved into place only once
+    # complete, so an interrupted run never leaves a truncated file behind.
+    if os.path.exists(filepath) and os.path.getsize(filepath) >= min_bytes:
+        return filepath
+    partial = filepath + ".tmp"
+    generate(partial, *args)
+    os.replace(partial, filepath)
+    return filepath
+
+def bench_log_parsers(workdir, sizes, repeat):
+    results = {}
+    for script, func_name, generate in LOG_PARSERS:
+        parse = getattr(load_script(script), func_name)
+        for size in sizes:
+            label = inputs.format_size(size)
+            filepath = ensure_input(os.path.join(workdir, f"{script}-{label}.log"), generate, size, min_bytes=size)
+            actual = os.path.getsize(filepath)
+            log(f"{script} [{label}]...")
+            result = measure(lambda: parse(filepath), repeat)
+            result["input_bytes"] = actual
+            result["throughput"] = actual / (1024 * 1024) / result["seconds"]
+            result["throughput_unit"] = "MB/s"
+            results[f"{script}[{label}]"] = result
+    return results
+
+def bench_analyze_deps(workdir, advisory_counts, repeat):
+    module = load_script("analyze_deps")
+    results = {}
+    for count in advisory_counts:
+        case_dir = os.path.join(workdir, f"analyze_deps-{count}")
+        os.makedirs(os.path.join(case_dir, "artifacts"), exist_ok=True)
+        audit_path = ensure_input(os.path.join(case_dir, "artifacts", "npm-audit.json"), inputs.generate_npm_audit, count)
+        ensure_input(os.path.join(case_dir, "artifacts", "npm-outdated.json"), inputs.generate_npm_outdated, count)
+
+        def run():
+            with working_directory(case_dir), contextlib.redirect_stdout(io.StringIO()):
+                module.main()
+
+        log(f"analyze_deps [{count} advisories]...")
+        result = measure(run, repeat)
+        result["input_bytes"] = os.path.getsize(audit_path)
+        result["throughput"] = count / result["seconds"]
+        result["throughput_unit"] = "advisories/s"
+        results[f"analyze_deps[{count}]"] = result
+    return results
+
+def bench_generate_summary(workdir, offender_counts, repeat):
+    module = load_script("generate_summary")
+    results = {}
+    for count in offender_counts:
+        case_dir = os.path.join(workdir, f"generate_summary-{count}")
+        os.makedirs(case_dir, exist_ok=True)
+        paths = inputs.generate_summary_inputs(case_dir, count)
+
+        def run():
+            module.generate_summary(paths["file-size"], paths["innerhtml"], paths["lint"], "2026-01-01")
+
+        log(f"generate_summary [{count} offenders]...")
+        result = measure(run, repeat)
+        result["input_bytes"] = sum(os.path.getsize(path) for path in paths.values())
+        result["throughput"] = count / result["seconds"]
+        result["throughput_unit"] = "offenders/s"
+        results[f"generate_summary[{count}]"] = result
+    return results
+
+def bench_startup(workdir, repeat):
+    """
+    Runs each script as a fresh interpreter on a tiny input, so the number is
+    dominated by interpreter start and import cost.
+    """
+    case_dir = os.path.join(workdir, "startup")
+    os.makedirs(os.path.join(case_dir, "artifacts"), exist_ok=True)
+    small = 4 * 1024
+    logs = {}
+    for script, _, generate in LOG_PARSERS:
+        logs[script] = os.path.join(case_dir, f"{script}.log")
+        generate(logs[script], small)
+    inputs.generate_npm_audit(os.path.join(case_dir, "artifacts", "npm-audit.json"), 10)
+    inputs.generate_npm_outdated(os.path.join(case_dir, "artifacts", "npm-outdated.json"), 10)
+    paths = inputs.generate_summary_inputs(case_dir, 10)
+
+    commands = {script: [SCRIPTS[script], logs[script]] for script in logs}
+    commands["generate_summary"] = [
+        SCRIPTS["generate_summary"], paths["file-size"], paths["innerhtml"], paths["lint"], "2026-01-01",
+    ]
+    commands["analyze_deps"] = [SCRIPTS["analyze_deps"]]
+
+    results = {}
+    for script, args in commands.items():
+        log(f"{script} [startup]...")
+        results[f"{script}[startup]"] = measure_startup(args, case_dir, repeat)
+    return results
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def compare(baseline, current, tolerance, memory_tolerance, min_delta_seconds):
+    """
+    Returns the (case, metric, old, new, change) rows, the subset that
+    regressed, and the baseline cases missing from `current`. `change` is the
+    relative difference, signed so that a positive value always means
+    "worse". Throughput is derived from `seconds`, so it is reported but
+    never gated. A timing change only counts as a regression when it also
+    exceeds `min_delta_seconds` in absolute terms, which keeps launch jitter
+    on short cases from failing the gate.
+    """
+    rows = []
+    regressions = []
+    base_results = baseline.get("results", {})
+    current_results = current.get("results", {})
+    missing = sorted(case for case in base_results if case not in current_results)
+    for case, metrics in sorted(current_results.items()):
+        old_metrics = base_results.get(case)
+        if not old_metrics:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old = old_metrics.get(metric)
+            new = metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if higher_is_better:
+                change = -change
+            row = (case, metric, old, new, change)
+            rows.append(row)
+            if metric not in GATED_METRICS:
+                continue
+            if metric in TIMING_METRICS and new - old <= min_delta_seconds:
+                continue
+            limit = memory_tolerance if metric in MEMORY_METRICS else tolerance
+            if change > limit:
+                regressions.append(row)
+    return rows, regressions, missing
+
+def print_comparison(rows, regressions, missing):
+    """
+    Prints the comparison and returns the gate's exit code: 1 when anything
+    regressed or when there was nothing to compare at all.
+    """
+    regressed = set(regressions)
+    for case, metric, old, new, change in rows:
+        marker = "REGRESSION" if (case, metric, old, new, change) in regressed else ""
+        print(f"{case:36} {metric:18} {old:>14.4f} -> {new:>14.4f} {change * 100:+7.1f}% {marker}")
+    if missing:
+        print(f"\nWARNING: {len(missing)} baseline case(s) missing from the current run: {', '.join(missing)}")
+    if not rows:
+        print("\nNo metrics in common with the baseline; nothing was compared.")
+        return 1
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed beyond tolerance.")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+def run(args):
+    sizes = parse_list(args.sizes, inputs.parse_size)
+    advisories = parse_list(args.advisories)
+    offenders = parse_list(args.offenders)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="bitvid-pybench-")
+    os.makedirs(workdir, exist_ok=True)
+    try:
+        results = {}
+        results.update(bench_log_parsers(workdir, sizes, args.repeat))
+        results.update(bench_analyze_deps(workdir, advisories, args.repeat))
+        results.update(bench_generate_summary(workdir, offenders, args.repeat))
+        results.update(bench_startup(workdir, args.startup_repeat))
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    commit = git_commit()
+    report = {
+        "meta": {
+            "commit": commit,
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    output = args.output or os.path.join(REPO_ROOT, "artifacts", f"python-bench-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        return print_comparison(*compare(baseline, report, args.tolerance, args.memory_tolerance, args.min_delta_seconds))
+    return 0
+
+def compare_files(args):
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)
+    with open(args.current, "r") as f:
+        current = json.load(f)
+    return print_comparison(*compare(baseline, current, args.tolerance, args.memory_tolerance, args.min_delta_seconds))
+
+def add_gate_arguments(parser):
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="allowed relative slowdown for run and startup time (default: 0.15)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.05,
+                        help="allowed relative growth of peak memory (default: 0.05)")
+    parser.add_argument("--min-delta-seconds", type=float, default=0.01,
+                        help="ignore run and startup time increases smaller than this many seconds (default: 0.01)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Python tooling in scripts/agent.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="generate inputs, run the benchmarks and save JSON results")
+    run_parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                            help=f"log sizes for the audit parsers, e.g. 1MB,1GB (default: {DEFAULT_SIZES})")
+    run_parser.add_argument("--advisories", default=DEFAULT_ADVISORIES,
+                            help=f"npm-audit advisory counts for analyze_deps.py (default: {DEFAULT_ADVISORIES})")
+    run_parser.add_argument("--offenders", default=DEFAULT_OFFENDERS,
+                            help=f"offender list lengths for generate_summary.py (default: {DEFAULT_OFFENDERS})")
+    run_parser.add_argument("--repeat", type=int, default=3, help="timed runs per case; the fastest is kept")
+    run_parser.add_argument("--startup-repeat", type=int, default=10,
+                            help="interpreter launches per startup case; the fastest is kept")
+    run_parser.add_argument("--workdir", help="keep generated inputs here and reuse them on later runs")
+    run_parser.add_argument("--output", help="results file (default: artifacts/python-bench-<commit>.json)")
+    run_parser.add_argument("--baseline", help="results file to compare against; exit 1 on regression")
+    add_gate_arguments(run_parser)
+
+    compare_parser = subparsers.add_parser("compare", help="compare two saved results files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    add_gate_arguments(compare_parser)
+
+    args = parser.parse_args()
+    if args.command == "run":
+        return run(args)
+    return compare_files(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+import json
+import os
+import random
+
+# Synthetic inputs for python_tooling_bench.py.
+#
+# The log generators mimic the raw output of check-file-size.mjs,
+# check-innerhtml.mjs and `npm run lint` closely enough that every regex in
+# scripts/agent/audit-parsers matches, and they grow the file until it reaches
+# the requested size in bytes. Everything is seeded so the same size always
+# produces the same bytes, which keeps results comparable across commits.
+
+CHUNK_BYTES = 1024 * 1024
+
+DIRS = ["js", "js/ui", "js/services", "js/nostr", "js/feedEngine", "js/ui/components", "views", "components"]
+SEVERITIES = ["low", "moderate", "high", "critical"]
+
+def parse_size(value):
+    """
+    Parses "512KB", "10MB", "1GB" or a plain byte count.
+    """
+    text = str(value).strip().upper()
+    units = {"GB": 1024 ** 3, "MB": 1024 ** 2, "KB": 1024, "B": 1}
+    for suffix, factor in units.items():
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * factor)
+    return int(text)
+
+def format_size(num_bytes):
+    for suffix, factor in (("GB", 1024 ** 3), ("MB", 1024 ** 2), ("KB", 1024)):
+        if num_bytes >= factor and num_bytes % factor == 0:
+            return f"{num_bytes // factor}{suffix}"
+    return f"{num_bytes}B"
+
+def _path(rng, i):
+    return f"{rng.choice(DIRS)}/module{i}.js"
+
+def _write_until(filepath, target_bytes, header, make_block):
+    """
+    Writes `header` then repeated blocks from `make_block(index)` until the
+    file reaches `target_bytes`. Output is buffered in ~1 MB chunks so that
+    multi-gigabyte files never have to fit in memory.
+    """
+    written = 0
+    index = 0
+    with open(filepath, "w", encoding="utf-8") as f:
+        data = header.encode("utf-8")
+        f.write(header)
+        written += len(data)
+        buffer = []
+        buffered = 0
+        while written + buffered < target_bytes:
+            block = make_block(index)
+            buffer.append(block)
+            buffered += len(block.encode("utf-8"))
+            index += 1
+            if buffered >= CHUNK_BYTES:
+                f.write("".join(buffer))
+                written += buffered
+                buffer = []
+                buffered = 0
+        if buffer:
+            f.write("".join(buffer))
+            written += buffered
+    return written
+
+def generate_lint_log(filepath, target_bytes, seed=1):
+    rng = random.Random(seed)
+    header = "> bitvid@0.0.0 lint\n> npm run lint:css && npm run lint:js && npm run lint:assets\n\n"
+
+    def block(i):
+        lines = []
+        if i % 50 == 0:
+            lines.append("[lint:assets] Missing dist/asset-manifest.json. Skipping asset reference check (build required).")
+        path = _path(rng, i)
+        errors = rng.randint(0, 4)
+        warnings = rng.randint(0, 3)
+        lines.append(path)
+        for n in range(errors + warnings):
+            kind = "error" if n < errors else "warning"
+            lines.append(f"  {rng.randint(1, 900)}:{rng.randint(1, 80)}  {kind}  Unexpected console statement  no-console")
+        if errors or warnings:
+            total = errors + warnings
+            lines.append(f"\n✖ {total} problems ({errors} errors, {warnings} warnings)")
+        if i % 200 == 199:
+            lines.append("npm ERR! code ELIFECYCLE")
+        return "\n".join(lines) + "\n\n"
+
+    return _write_until(filepath, target_bytes, header, block)
+
+def generate_file_size_log(filepath, target_bytes, seed=2):
+    rng = random.Random(seed)
+    header = "Checking file sizes (threshold: 1000 lines)\n\n"
+
+    def block(i):
+        path = _path(rng, i)
+        roll = i % 10
+        if roll < 7:
+            return f"  ⚠ grandfathered: {path} ({rng.randint(1001, 4000)} lines)\n"
+        if roll < 9:
+            return f"  ✗ NEW: {path} ({rng.randint(1001, 2500)} lines, threshold 1000)\n"
+        was = rng.randint(1001, 3000)
+        limit = was + 50
+        return f"  ✗ GREW: {path} ({limit + rng.randint(1, 400)} lines, was {was}, limit {limit})\n"
+
+    return _write_until(filepath, target_bytes, header, block)
+
+def generate_innerhtml_log(filepath, target_bytes, seed=3):
+    rng = random.Random(seed)
+    # The summary line carries made-up totals; the parser only reads them.
+    header = "innerHTML usage: 87000 assignments across 34000 files\n\n"
+
+    def block(i):
+        path = _path(rng, i)
+        count = rng.randint(1, 40)
+        if i % 25 == 24:
+            baseline = max(count - 3, 0)
+            lines = ", ".join(str(rng.randint(1, 900)) for _ in range(count - baseline))
+            return (
+                f"  {path}: {count} ← NEW\n"
+                f"  ✗ {path}: {count} total (baseline {baseline}, +{count - baseline} new) at line(s) {lines}\n"
+            )
+        return f"  {path}: {count}\n"
+
+    return _write_until(filepath, target_bytes, header, block)
+
+def generate_npm_audit(filepath, advisories, seed=4):
+    """
+    Writes an `npm audit --json` (v2 format) report with `advisories`
+    vulnerable packages, each with a mix of advisory and transitive `via`
+    entries.
+    """
+    rng = random.Random(seed)
+    vulnerabilities = {}
+    counts = {severity: 0 for severity in SEVERITIES}
+    for i in range(advisories):
+        name = f"pkg-{i}"
+        severity = rng.choice(SEVERITIES)
+        counts[severity] += 1
+        via = []
+        for n in range(rng.randint(1, 4)):
+            if i > 0 and n % 2 == 1:
+                via.append(f"pkg-{rng.randrange(i)}")
+            else:
+                via.append({
+                    "source": 1000000 + i * 4 + n,
+                    "name": name,
+                    "dependency": name,
+                    "title": f"Prototype pollution in {name}",
+                    "url": f"https://github.com/advisories/GHSA-{i:04x}-{n:04x}-bench",
+                    "severity": severity,
+                    "cwe": ["CWE-1321"],
+                    "cvss": {"score": round(rng.uniform(1, 10), 1), "vectorString": None},
+                    "range": f"<{rng.randint(1, 9)}.{rng.randint(0, 20)}.0",
+                })
+        fix_available = rng.choice([True, False, {"name": name, "version": "9.9.9", "isSemVerMajor": True}])
+        vulnerabilities[name] = {
+            "name": name,
+            "severity": severity,
+            "isDirect": rng.random() < 0.2,
+            "via": via,
+            "effects": [f"pkg-{rng.randrange(advisories)}" for _ in range(rng.randint(0, 3))],
+            "range": "*",
+            "nodes": [f"node_modules/{name}"],
+            "fixAvailable": fix_available,
+        }
+    counts["info"] = 0
+    counts["total"] = advisories
+    report = {
+        "auditReportVersion": 2,
+        "vulnerabilities": vulnerabilities,
+        "metadata": {
+            "vulnerabilities": counts,
+            "dependencies": {"prod": advisories, "dev": 0, "optional": 0, "peer": 0, "peerOptional": 0, "total": advisories},
+        },
+    }
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return os.path.getsize(filepath)
+
+def generate_npm_outdated(filepath, packages, seed=5):
+    rng = random.Random(seed)
+    outdated = {}
+    for i in range(packages):
+        major = rng.randint(0, 9)
+        minor = rng.randint(0, 20)
+        current = f"{major}.{minor}.0"
+        roll = rng.random()
+        wanted = f"{major}.{minor}.{rng.randint(1, 9)}" if roll < 0.5 else current
+        latest = f"{major + 1}.0.0" if roll > 0.3 else wanted
+        outdated[f"pkg-{i}"] = {
+            "current": current,
+            "wanted": wanted,
+            "latest": latest,
+            "dependent": "bitvid",
+            "location": f"node_modules/pkg-{i}",
+            "type": rng.choice(["dependencies", "devDependencies"]),
+        }
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(outdated, f, indent=2)
+    return os.path.getsize(filepath)
+
+def generate_summary_inputs(directory, offenders, seed=6):
+    """
+    Writes the three parser reports consumed by generate_summary.py, with
+    `offenders` entries in each of the offender/violation lists.
+    """
+    rng = random.Random(seed)
+    new_list = [
+        {"path": _path(rng, i), "lines": 1000 + n, "excess": n}
+        for i, n in enumerate(rng.randint(1, 2000) for _ in range(offenders))
+    ]
+    file_size = {
+        "grandfathered_files": offenders,
+        "grandfathered_excess_lines": offenders * 500,
+        "new_oversized_files": len(new_list),
+        "new_excess_lines": sum(item["excess"] for item in new_list),
+        "grandfathered_list": [
+            {"path": _path(rng, i), "lines": 1500, "excess": 500} for i in range(offenders)
+        ],
+        "new_list": new_list,
+    }
+    top_offenders = [
+        {"path": _path(rng, i), "count": rng.randint(1, 100), "is_new": rng.random() < 0.1}
+        for i in range(offenders)
+    ]
+    innerhtml = {
+        "total_assignments": sum(item["count"] for item in top_offenders),
+        "files_count": offenders,
+        "top_offenders": top_offenders,
+        "violations": [
+            {"path": item["path"], "total": item["count"], "baseline": 0, "new": item["count"], "lines": "1, 2"}
+            for item in top_offenders
+            if item["is_new"]
+        ],
+    }
+    lint = {
+        "total_failures": offenders,
+        "files_with_errors": [],
+        "skipped_checks": [
+            {"check": f"lint:check{i}", "reason": "Missing dist/asset-manifest.json.", "details": "asset reference check"}
+            for i in range(max(offenders // 100, 1))
+        ],
+    }
+    paths = {}
+    for name, data in (("file-size", file_size), ("innerhtml", innerhtml), ("lint", lint)):
+        paths[name] = os.path.join(directory, f"{name}-report.json")
+        with open(paths[name], "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    return paths
@@ -0,0 +1,113 @@
+import pytest
+
+import python_tooling_bench as bench
+import python_tooling_inputs as inputs
+
+def _compare(baseline, current, tolerance=0.15, memory_tolerance=0.05, min_delta_seconds=0.01):
+    return bench.compare({"results": baseline}, {"results": current}, tolerance, memory_tolerance, min_delta_seconds)
+
+def _regressed(regressions):
+    return {(case, metric) for case, metric, _, _, _ in regressions}
+
+def test_timing_regression_is_reported():
+    baseline = {"parse_lint[10MB]": {"seconds": 1.0}}
+    current = {"parse_lint[10MB]": {"seconds": 1.3}}
+    rows, regressions, missing = _compare(baseline, current)
+    assert len(rows) == 1
+    assert _regressed(regressions) == {("parse_lint[10MB]", "seconds")}
+    assert missing == []
+
+def test_timing_within_tolerance_passes():
+    baseline = {"parse_lint[10MB]": {"seconds": 1.0}}
+    current = {"parse_lint[10MB]": {"seconds": 1.1}}
+    _, regressions, _ = _compare(baseline, current)
+    assert regressions == []
+
+def test_memory_regression_uses_memory_tolerance():
+    baseline = {"parse_lint[10MB]": {"seconds": 1.0, "peak_memory_bytes": 1000}}
+    current = {"parse_lint[10MB]": {"seconds": 1.0, "peak_memory_bytes": 1100}}
+    _, regressions, _ = _compare(baseline, current)
+    assert _regressed(regressions) == {("parse_lint[10MB]", "peak_memory_bytes")}
+
+def test_throughput_is_reported_but_only_seconds_is_gated():
+    baseline = {"analyze_deps[5000]": {"seconds": 1.0, "throughput": 5000}}
+    current = {"analyze_deps[5000]": {"seconds": 1.25, "throughput": 4000}}
+    rows, regressions, _ = _compare(baseline, current)
+    assert {metric for _, metric, _, _, _ in rows} == {"seconds", "throughput"}
+    assert _regressed(regressions) == {("analyze_deps[5000]", "seconds")}
+
+def test_slowdown_of_a_short_case_is_a_regression():
+    baseline = {"parse_lint[1MB]": {"seconds": 0.035}}
+    current = {"parse_lint[1MB]": {"seconds": 0.063}}
+    _, regressions, _ = _compare(baseline, current)
+    assert _regressed(regressions) == {("parse_lint[1MB]", "seconds")}
+
+def test_change_below_min_delta_is_not_a_regression():
+    baseline = {"parse_lint[1MB]": {"seconds": 0.030, "peak_memory_bytes": 1000}}
+    current = {"parse_lint[1MB]": {"seconds": 0.036, "peak_memory_bytes": 2000}}
+    _, regressions, _ = _compare(baseline, current)
+    assert _regressed(regressions) == {("parse_lint[1MB]", "peak_memory_bytes")}
+
+def test_startup_regression_is_reported():
+    baseline = {"parse_lint[startup]": {"startup_seconds": 0.030}}
+    current = {"parse_lint[startup]": {"startup_seconds": 0.045}}
+    _, regressions, _ = _compare(baseline, current)
+    assert _regressed(regressions) == {("parse_lint[startup]", "startup_seconds")}
+
+def test_startup_jitter_below_min_delta_passes():
+    baseline = {"parse_lint[startup]": {"startup_seconds": 0.030}}
+    current = {"parse_lint[startup]": {"startup_seconds": 0.036}}
+    rows, regressions, _ = _compare(baseline, current)
+    assert len(rows) == 1
+    assert regressions == []
+
+def test_disjoint_cases_compare_nothing_and_fail(capsys):
+    baseline = {"parse_lint[1GB]": {"seconds": 10.0}}
+    current = {"parse_lint[10MB]": {"seconds": 0.1}}
+    rows, regressions, missing = _compare(baseline, current)
+    assert rows == []
+    assert missing == ["parse_lint[1GB]"]
+    assert bench.print_comparison(rows, regressions, missing) == 1
+    assert "parse_lint[1GB]" in capsys.readouterr().out
+
+def test_print_comparison_passes_without_regressions():
+    rows, regressions, missing = _compare(
+        {"parse_lint[10MB]": {"seconds": 1.0}},
+        {"parse_lint[10MB]": {"seconds": 1.0}},
+    )
+    assert bench.print_comparison(rows, regressions, missing) == 0
+
+@pytest.mark.parametrize("text, num_bytes", [
+    ("1GB", 1024 ** 3),
+    ("100MB", 100 * 1024 ** 2),
+    ("512KB", 512 * 1024),
+    ("4096", 4096),
+])
+def test_parse_size_round_trips(text, num_bytes):
+    assert inputs.parse_size(text) == num_bytes
+    assert inputs.parse_size(inputs.format_size(num_bytes)) == num_bytes
+    assert inputs.format_size(num_bytes) == (text if not text.isdigit() else "4KB")
+
+def test_format_size_keeps_odd_byte_counts():
+    assert inputs.format_size(1500) == "1500B"
+    assert inputs.parse_size("1500B") == 1500
+
+def test_ensure_input_regenerates_truncated_files(tmp_path):
+    filepath = str(tmp_path / "parse_lint-8KB.log")
+    with open(filepath, "w") as f:
+        f.write("truncated")
+    bench.ensure_input(filepath, inputs.generate_lint_log, 8192, min_bytes=8192)
+    assert (tmp_path / "parse_lint-8KB.log").stat().st_size >= 8192
+    assert not (tmp_path / "parse_lint-8KB.log.tmp").exists()
+
+@pytest.mark.parametrize("script, func_name, generate, fields", [
+    ("parse_lint", "parse_lint_log", inputs.generate_lint_log, ["skipped_checks", "total_failures"]),
+    ("parse_file_size", "parse_file_size_log", inputs.generate_file_size_log, ["grandfathered_list", "new_list"]),
+    ("parse_innerhtml", "parse_innerhtml_log", inputs.generate_innerhtml_log, ["top_offenders", "violations"]),
+])
+def test_generated_logs_match_the_parsers(tmp_path, script, func_name, generate, fields):
+    filepath = str(tmp_path / f"{script}.log")
+    generate(filepath, 64 * 1024)
+    metrics = getattr(bench.load_script(script), func_name)(filepath)
+    for field in fields:
+        assert metrics[field], f"{script} found no {field} in the generated log"